@@ -4,12 +4,13 @@ import os
 
 import requests
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Blueprint, Flask, abort, jsonify, make_response, request
 from flask_sqlalchemy import SQLAlchemy
 from marshmallow import Schema, fields
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, load_only, mapped_column, relationship, selectinload
 
-from config import DEFAULT_PORT, NOT_FOUND, OK
+from compression import init_compression
+from config import BAD_REQUEST, DEFAULT_PORT, NOT_FOUND, OK
 
 load_dotenv()
 
@@ -31,11 +32,40 @@ ID_FILM8 = 361
 ID_FILM9 = 4370148
 ID_FILM10 = 255611
 ID_FILM11 = 463724
+MOVIE_IDS = (
+    ID_FILM1,
+    ID_FILM2,
+    ID_FILM3,
+    ID_FILM4,
+    ID_FILM5,
+    ID_FILM6,
+    ID_FILM7,
+    ID_FILM8,
+    ID_FILM9,
+    ID_FILM10,
+    ID_FILM11,
+)
 LENGTH_USERNAME = 80
 LENGTH_EMAIL_PASSWORD = 120
 LENGTH_OTHER_DATA = 255
 WATCHLIST = 'watchlist'
 WATCHED = 'watched'
+FIELDS = 'fields'
+MOVIE_FIELDS = frozenset((
+    'id',
+    'title',
+    'year',
+    'description',
+    'kinopoisk_rating',
+    'genres',
+    'poster_url',
+    'actors',
+    'director',
+))
+USER_COLUMNS = frozenset(('id', 'username', 'email'))
+USER_FIELDS = USER_COLUMNS | {WATCHLIST, WATCHED} | {
+    f'{relation}.{name}' for relation in (WATCHLIST, WATCHED) for name in MOVIE_FIELDS
+}
 
 
 def get_connection() -> str:
@@ -51,9 +81,8 @@ def get_connection() -> str:
     return f'postgresql://{user}:{password}@{host}:{port}/{dbname}'
 
 
-app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = get_connection()
-db = SQLAlchemy(app)
+db = SQLAlchemy()
+api = Blueprint('api', __name__)
 
 
 class User(db.Model):
@@ -226,19 +255,80 @@ def get_movie_info(movie_id) -> dict:
         }
 
 
-@app.route('/movies', methods=[GET_REQUEST])
+def get_fields(allowed: frozenset) -> tuple | None:
+    """Получает список запрошенных полей из параметра `fields`.
+
+    Args:
+        allowed: Поля, которые разрешено запрашивать.
+
+    Returns:
+        tuple | None: Запрошенные поля или None, если параметр не передан.
+    """
+    fields_param = request.args.get(FIELDS)
+    if fields_param is None:
+        return None
+    requested = tuple(dict.fromkeys(
+        name.strip() for name in fields_param.split(',') if name.strip()
+    ))
+    unknown = sorted(set(requested) - allowed)
+    if not requested or unknown:
+        unknown_list = ', '.join(unknown)
+        message = f'Недопустимые поля: {unknown_list}' if unknown else 'Поля не указаны'
+        abort(make_response(jsonify({ERROR: message}), BAD_REQUEST))
+    return requested
+
+
+def load_fields(model, field_names: tuple | None, columns: frozenset) -> list:
+    """Формирует опции запроса, загружающие из базы только запрошенные колонки.
+
+    Поля вида `watchlist.title` загружают связанные объекты отдельным
+    запросом только с указанными колонками.
+
+    Args:
+        model: Модель, для которой строится запрос.
+        field_names: Запрошенные поля или None, если нужны все.
+        columns: Поля модели, которые являются колонками таблицы.
+
+    Returns:
+        list: Опции для запроса SQLAlchemy.
+    """
+    if field_names is None:
+        return []
+    options = [load_only(
+        model.id, *[getattr(model, name) for name in field_names if name in columns],
+    )]
+    nested = {}
+    for field_name in field_names:
+        relation_name, _, column_name = field_name.partition('.')
+        if column_name:
+            nested.setdefault(relation_name, ['id']).append(column_name)
+    for relation_name, column_names in nested.items():
+        relation = getattr(model, relation_name)
+        target = relation.property.mapper.class_
+        options.append(selectinload(relation).load_only(
+            *[getattr(target, nested_name) for nested_name in column_names],
+        ))
+    return options
+
+
+@api.route('/movies', methods=[GET_REQUEST])
 def get_movies() -> str:
     """Получает список всех фильмов.
 
     Returns:
         str: JSON с данными о фильмах.
     """
-    movies = db.session.query(Movie).all()
-    movie_schema = MovieSchema(many=True)
+    fields_list = get_fields(MOVIE_FIELDS)
+    movies = (
+        db.session.query(Movie).
+        options(*load_fields(Movie, fields_list, MOVIE_FIELDS)).
+        all()
+    )
+    movie_schema = MovieSchema(many=True, only=fields_list)
     return jsonify(movie_schema.dump(movies))
 
 
-@app.route('/movies/<int:movie_id>', methods=[GET_REQUEST])
+@api.route('/movies/<int:movie_id>', methods=[GET_REQUEST])
 def get_movie(movie_id) -> str:
     """Получает информацию о конкретном фильме по его идентификатору.
 
@@ -248,14 +338,17 @@ def get_movie(movie_id) -> str:
     Returns:
         str: JSON с данными о фильме.
     """
-    movie = db.session.get(Movie, movie_id)
+    fields_list = get_fields(MOVIE_FIELDS)
+    movie = db.session.get(
+        Movie, movie_id, options=load_fields(Movie, fields_list, MOVIE_FIELDS),
+    )
     if movie is None:
         return jsonify({ERROR: 'Не найдено'}), NOT_FOUND
-    movie_schema = MovieSchema()
+    movie_schema = MovieSchema(only=fields_list)
     return jsonify(movie_schema.dump(movie))
 
 
-@app.route('/movies/search', methods=[GET_REQUEST])
+@api.route('/movies/search', methods=[GET_REQUEST])
 def search_movies() -> str:
     """Поиск фильмов по названию.
 
@@ -263,18 +356,20 @@ def search_movies() -> str:
         str: JSON с данными о найденных фильмах.
     """
     title = request.args.get('title')
+    fields_list = get_fields(MOVIE_FIELDS)
     movies = (
         db.session.query(Movie).
+        options(*load_fields(Movie, fields_list, MOVIE_FIELDS)).
         filter(
             Movie.title.ilike(f'%{title}%'),
         ).
         all()
     )
-    movie_schema = MovieSchema(many=True)
+    movie_schema = MovieSchema(many=True, only=fields_list)
     return jsonify(movie_schema.dump(movies))
 
 
-@app.route('/users/<int:user_id>/watchlist/<int:movie_id>', methods=['POST'])
+@api.route('/users/<int:user_id>/watchlist/<int:movie_id>', methods=['POST'])
 def add_to_watchlist(user_id, movie_id) -> str:
     """Добавляет фильм в список 'хочу посмотреть' для определенного пользователя.
 
@@ -297,7 +392,7 @@ def add_to_watchlist(user_id, movie_id) -> str:
     return jsonify({MESSAGE: "Фильм добавлен в список 'хочу посмотреть'"})
 
 
-@app.route('/users/<int:user_id>/watched/<int:movie_id>', methods=['POST'])
+@api.route('/users/<int:user_id>/watched/<int:movie_id>', methods=['POST'])
 def add_to_watched(user_id, movie_id) -> str:
     """Добавляет фильм в список 'уже посмотрел' для определенного пользователя.
 
@@ -320,7 +415,7 @@ def add_to_watched(user_id, movie_id) -> str:
     return jsonify({MESSAGE: "Фильм добавлен в список 'уже посмотрел'"})
 
 
-@app.route('/users/<int:user_id>/watchlist/<int:movie_id>', methods=['DELETE'])
+@api.route('/users/<int:user_id>/watchlist/<int:movie_id>', methods=['DELETE'])
 def remove_from_watchlist(user_id, movie_id) -> str:
     """Удаляет фильм из списка 'хочу посмотреть' для определенного пользователя.
 
@@ -345,7 +440,7 @@ def remove_from_watchlist(user_id, movie_id) -> str:
     return jsonify({ERROR: 'Фильма нет в списке'}), NOT_FOUND
 
 
-@app.route('/users/<int:user_id>/watched/<int:movie_id>', methods=['DELETE'])
+@api.route('/users/<int:user_id>/watched/<int:movie_id>', methods=['DELETE'])
 def remove_from_watched(user_id, movie_id) -> str:
     """Удаляет фильм из списка 'уже посмотрел' для определенного пользователя.
 
@@ -370,7 +465,7 @@ def remove_from_watched(user_id, movie_id) -> str:
     return jsonify({ERROR: 'Фильма нет в списке'}), NOT_FOUND
 
 
-@app.route('/users', methods=['POST'])
+@api.route('/users', methods=['POST'])
 def create_user() -> str:
     """Создает нового пользователя.
 
@@ -389,7 +484,7 @@ def create_user() -> str:
     return jsonify(user_schema.dump(user))
 
 
-@app.route('/users/<int:user_id>', methods=[GET_REQUEST])
+@api.route('/users/<int:user_id>', methods=[GET_REQUEST])
 def get_user(user_id) -> str:
     """Получает информацию о конкретном пользователе.
 
@@ -399,15 +494,18 @@ def get_user(user_id) -> str:
     Returns:
         str: JSON с данными о пользователе.
     """
-    user = db.session.get(User, user_id)
+    fields_list = get_fields(USER_FIELDS)
+    user = db.session.get(
+        User, user_id, options=load_fields(User, fields_list, USER_COLUMNS),
+    )
     if user is None:
         return jsonify({ERROR: ERROR_USER}), NOT_FOUND
 
-    user_schema = UserSchema()
+    user_schema = UserSchema(only=fields_list)
     return jsonify(user_schema.dump(user))
 
 
-@app.route('/users/<int:user_id>', methods=['PUT'])
+@api.route('/users/<int:user_id>', methods=['PUT'])
 def update_user(user_id) -> str:
     """Обновляет информацию о конкретном пользователе.
 
@@ -431,30 +529,39 @@ def update_user(user_id) -> str:
     return jsonify(user_schema.dump(user))
 
 
-with app.app_context():
-    db.create_all()
-
-with app.app_context():
-    if not Movie.query.all():
-        movies = [
-            get_movie_info(ID_FILM1),
-            get_movie_info(ID_FILM2),
-            get_movie_info(ID_FILM3),
-            get_movie_info(ID_FILM4),
-            get_movie_info(ID_FILM5),
-            get_movie_info(ID_FILM6),
-            get_movie_info(ID_FILM7),
-            get_movie_info(ID_FILM8),
-            get_movie_info(ID_FILM9),
-            get_movie_info(ID_FILM10),
-            get_movie_info(ID_FILM11),
-        ]
+def seed_movies() -> None:
+    """Заполняет пустую таблицу фильмов данными из API Кинопоиска."""
+    if db.session.query(Movie).first() is None:
+        movies = [get_movie_info(movie_id) for movie_id in MOVIE_IDS]
         db.session.bulk_insert_mappings(Movie, movies)
         db.session.commit()
 
-with app.app_context():
-    db.create_all()
+
+def create_app(config: dict | None = None) -> Flask:
+    """Создает и настраивает приложение.
+
+    Args:
+        config: Настройки, которые переопределяют значения по умолчанию.
+
+    Returns:
+        Flask: Приложение с подключенной базой данных и маршрутами API.
+    """
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = get_connection()
+    app.config['SEED_MOVIES'] = True
+    app.config.from_mapping(config or {})
+    db.init_app(app)
+    init_compression(app)
+    app.register_blueprint(api)
+
+    with app.app_context():
+        db.create_all()
+        if app.config['SEED_MOVIES']:
+            seed_movies()
+
+    return app
+
 
 if __name__ == '__main__':
     FLASK_PORT = os.getenv('FLASK_PORT', default=DEFAULT_PORT)
-    app.run(port=FLASK_PORT)
+    create_app().run(port=FLASK_PORT)
@@ -0,0 +1,133 @@
+"""Модуль сравнивает затраты CPU и размер ответа для разных алгоритмов сжатия."""
+
+import json
+import random
+import sys
+import timeit
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType
+
+from compression import BROTLI, GZIP, ZSTD, compress, get_encodings
+
+MOVIES_COUNT = 300
+REPEATS = 3
+MS_IN_SECOND = 1000
+POSTER_URL = 'https://image.openmoviedb.com/kinopoisk-images/{0:x}/orig'
+SEED = 42
+LETTERS = 'абвгдежзиклмнопрстуфхцчшэюя'
+WORDS_COUNT = 5000
+NAMES_COUNT = 3000
+DESCRIPTION_WORDS = 60
+ACTORS_COUNT = 10
+MAX_WORD_LENGTH = 12
+MIN_YEAR = 1920
+MAX_YEAR = 2024
+MIN_RATING = 3
+MAX_RATING = 9.5
+POSTER_ID_BITS = 64
+ROW = '{0:<8} {1:>5} {2:>10} {3:>6.1f} {4:>12.2f}\n'
+GENRES = ('драма', 'комедия', 'триллер', 'боевик', 'мелодрама', 'фантастика', 'ужасы')
+LEVELS = MappingProxyType({
+    GZIP: (1, 6, 9),
+    BROTLI: (1, 5, 11),
+    ZSTD: (1, 3, 19),
+})
+
+
+def make_words(rng: random.Random, count: int) -> list:
+    """Создает словарь из случайных слов разной длины.
+
+    Args:
+        rng: Генератор случайных чисел.
+        count: Количество слов.
+
+    Returns:
+        list: Слова.
+    """
+    return [
+        ''.join(rng.choices(LETTERS, k=rng.randint(2, MAX_WORD_LENGTH)))
+        for _ in range(count)
+    ]
+
+
+def build_payload(movies_count: int) -> bytes:
+    """Собирает JSON, похожий на ответ /movies для большого каталога.
+
+    Тексты составлены из случайных слов и имен, чтобы степень сжатия
+    не завышалась повторами. Как и jsonify, кириллица экранируется.
+
+    Args:
+        movies_count: Количество фильмов в каталоге.
+
+    Returns:
+        bytes: Тело ответа.
+    """
+    rng = random.Random(SEED)
+    words = make_words(rng, WORDS_COUNT)
+    names = [
+        f'{first.title()} {last.title()}'
+        for first, last in zip(make_words(rng, NAMES_COUNT), make_words(rng, NAMES_COUNT))
+    ]
+    movies = [
+        {
+            'id': movie_id,
+            'title': ' '.join(rng.choices(words, k=rng.randint(1, 4))).capitalize(),
+            'year': rng.randint(MIN_YEAR, MAX_YEAR),
+            'description': ' '.join(rng.choices(words, k=DESCRIPTION_WORDS)).capitalize(),
+            'kinopoisk_rating': round(rng.uniform(MIN_RATING, MAX_RATING), 1),
+            'genres': str(rng.sample(GENRES, k=rng.randint(1, 3))),
+            'poster_url': POSTER_URL.format(rng.getrandbits(POSTER_ID_BITS)),
+            'actors': str(rng.sample(names, k=ACTORS_COUNT)),
+            'director': str([rng.choice(names)]),
+        }
+        for movie_id in range(movies_count)
+    ]
+    return json.dumps(movies).encode()
+
+
+def load_payload(argument: str | None) -> bytes:
+    """Читает сохраненный ответ /movies из файла или собирает синтетический.
+
+    Args:
+        argument: Путь к файлу с JSON или количество фильмов.
+
+    Returns:
+        bytes: Тело ответа.
+    """
+    if argument is None:
+        return build_payload(MOVIES_COUNT)
+    if argument.isdigit():
+        return build_payload(int(argument))
+    return Path(argument).read_bytes()
+
+
+def main() -> None:
+    """Печатает размер, степень сжатия и время сжатия для каждого уровня.
+
+    Первый аргумент командной строки: количество фильмов для синтетического
+    каталога или путь к сохраненному ответу /movies, например
+    `curl localhost:5000/movies > movies.json`.
+    """
+    body = load_payload(sys.argv[1] if len(sys.argv) > 1 else None)
+    sys.stdout.write(f'identity: {len(body)} bytes\n')
+    sys.stdout.write('encoding level      bytes  ratio  ms/compress\n')
+    for encoding in get_encodings():
+        for level in LEVELS[encoding]:
+            compressed = compress(body, encoding, level)
+            seconds = min(timeit.repeat(
+                partial(compress, body, encoding, level),
+                number=1,
+                repeat=REPEATS,
+            ))
+            sys.stdout.write(ROW.format(
+                encoding,
+                level,
+                len(compressed),
+                len(body) / len(compressed),
+                seconds * MS_IN_SECOND,
+            ))
+
+
+if __name__ == '__main__':
+    main()
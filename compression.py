@@ -0,0 +1,181 @@
+"""Модуль сжимает ответы API и кэширует сжатые тела ответов."""
+
+import gzip
+import os
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from types import MappingProxyType
+
+from flask import Flask, Response, current_app, request
+
+from config import (
+    COMPRESS_BROTLI_LEVEL,
+    COMPRESS_CACHE_BYTES,
+    COMPRESS_GZIP_LEVEL,
+    COMPRESS_MIN_SIZE,
+    COMPRESS_ZSTD_LEVEL,
+    OK,
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+GZIP = 'gzip'
+BROTLI = 'br'
+ZSTD = 'zstd'
+EXTENSION = 'compression'
+CACHE = 'cache'
+LOCK = 'lock'
+CACHE_BYTES = 'cache_bytes'
+ACCEPT_ENCODING = 'Accept-Encoding'
+CONTENT_ENCODING = 'Content-Encoding'
+COMPRESSIBLE_MIMETYPES = frozenset(('application/json',))
+CACHEABLE_METHODS = frozenset(('GET', 'HEAD'))
+ETAG_DIGEST_SIZE = 16
+LEVEL_KEYS = MappingProxyType({
+    ZSTD: 'COMPRESS_ZSTD_LEVEL',
+    BROTLI: 'COMPRESS_BROTLI_LEVEL',
+    GZIP: 'COMPRESS_GZIP_LEVEL',
+})
+DEFAULTS = MappingProxyType({
+    'COMPRESS_MIN_SIZE': COMPRESS_MIN_SIZE,
+    'COMPRESS_CACHE_BYTES': COMPRESS_CACHE_BYTES,
+    'COMPRESS_ZSTD_LEVEL': COMPRESS_ZSTD_LEVEL,
+    'COMPRESS_BROTLI_LEVEL': COMPRESS_BROTLI_LEVEL,
+    'COMPRESS_GZIP_LEVEL': COMPRESS_GZIP_LEVEL,
+})
+
+
+def get_encodings() -> tuple:
+    """Возвращает доступные алгоритмы сжатия в порядке предпочтения сервера.
+
+    Returns:
+        tuple: Названия алгоритмов в формате заголовка Content-Encoding.
+    """
+    available = {ZSTD: zstandard, BROTLI: brotli, GZIP: gzip}
+    return tuple(encoding for encoding, module in available.items() if module is not None)
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    """Сжимает тело ответа выбранным алгоритмом.
+
+    Args:
+        body: Тело ответа.
+        encoding: Алгоритм сжатия.
+        level: Уровень сжатия.
+
+    Returns:
+        bytes: Сжатое тело ответа.
+    """
+    if encoding == ZSTD:
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    if encoding == BROTLI:
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def init_compression(app: Flask) -> None:
+    """Подключает сжатие ответов к приложению.
+
+    Настройки берутся из конфигурации приложения, затем из переменных
+    окружения с теми же именами, затем из значений по умолчанию.
+
+    Args:
+        app: Приложение Flask.
+    """
+    for key, default in DEFAULTS.items():
+        app.config.setdefault(key, int(os.getenv(key, default=default)))
+    app.extensions[EXTENSION] = {CACHE: OrderedDict(), CACHE_BYTES: 0, LOCK: Lock()}
+    app.after_request(compress_response)
+
+
+def choose_encoding(size: int) -> str | None:
+    """Выбирает алгоритм сжатия по заголовку Accept-Encoding запроса.
+
+    Args:
+        size: Размер тела ответа в байтах.
+
+    Returns:
+        str | None: Алгоритм сжатия или None, если сжимать не нужно.
+    """
+    if size < current_app.config['COMPRESS_MIN_SIZE']:
+        return None
+    return request.accept_encodings.best_match(get_encodings())
+
+
+def get_compressed(etag: str, body: bytes, encoding: str) -> bytes:
+    """Возвращает сжатое тело ответа из кэша или сжимает и сохраняет его.
+
+    Размер кэша ограничен суммарным объемом сжатых тел COMPRESS_CACHE_BYTES
+    в каждом процессе; при переполнении удаляются давно не запрошенные тела.
+
+    Args:
+        etag: ETag сжатого ответа, используется как ключ кэша.
+        body: Тело ответа.
+        encoding: Алгоритм сжатия.
+
+    Returns:
+        bytes: Сжатое тело ответа.
+    """
+    state = current_app.extensions[EXTENSION]
+    cache = state[CACHE]
+    with state[LOCK]:
+        compressed = cache.get(etag)
+        if compressed is not None:
+            cache.move_to_end(etag)
+            return compressed
+
+    compressed = compress(body, encoding, current_app.config[LEVEL_KEYS[encoding]])
+    max_bytes = current_app.config['COMPRESS_CACHE_BYTES']
+    with state[LOCK]:
+        if etag not in cache and len(compressed) <= max_bytes:
+            cache[etag] = compressed
+            state[CACHE_BYTES] += len(compressed)
+        while state[CACHE_BYTES] > max_bytes:
+            _, evicted = cache.popitem(last=False)
+            state[CACHE_BYTES] -= len(evicted)
+    return compressed
+
+
+def compress_response(response: Response) -> Response:
+    """Сжимает JSON-ответ и добавляет ETag для GET- и HEAD-запросов.
+
+    Сжатые тела успешных GET- и HEAD-ответов кэшируются по ETag, поэтому
+    одинаковые ответы сжимаются один раз.
+
+    Args:
+        response: Ответ приложения.
+
+    Returns:
+        Response: Сжатый ответ или исходный ответ, если сжатие не применимо.
+    """
+    if response.direct_passthrough or CONTENT_ENCODING in response.headers:
+        return response
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return response
+
+    response.vary.add(ACCEPT_ENCODING)
+    body = response.get_data()
+    encoding = choose_encoding(len(body))
+    if request.method not in CACHEABLE_METHODS or response.status_code != OK:
+        if encoding is not None:
+            level = current_app.config[LEVEL_KEYS[encoding]]
+            response.set_data(compress(body, encoding, level))
+            response.headers[CONTENT_ENCODING] = encoding
+        return response
+
+    etag = blake2b(body, digest_size=ETAG_DIGEST_SIZE).hexdigest()
+    if encoding is not None:
+        etag = f'{etag}-{encoding}'
+        response.set_data(get_compressed(etag, body, encoding))
+        response.headers[CONTENT_ENCODING] = encoding
+    response.set_etag(etag)
+    return response.make_conditional(request.environ)
@@ -2,6 +2,13 @@
 
 BASE_URL = 'https://api.kinopoisk.dev/v1.4'
 OK = 200
+NOT_MODIFIED = 304
+BAD_REQUEST = 400
 NOT_FOUND = 404
 YANDEX_KEY_HEADER = 'X-API-KEY'
 DEFAULT_PORT = 5000
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_CACHE_BYTES = 8 * 1024 * 1024
+COMPRESS_GZIP_LEVEL = 6
+COMPRESS_BROTLI_LEVEL = 5
+COMPRESS_ZSTD_LEVEL = 3
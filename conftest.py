@@ -0,0 +1,313 @@
+"""Фикстуры для изолированного тестирования API из файла app.py."""
+
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
+
+import pytest
+import sqlalchemy as sa
+from flask import Flask, has_request_context, request
+from flask.testing import FlaskClient
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from app import NAME, Movie, create_app, db, get_connection
+from config import OK
+
+TEST_DATABASE = os.environ.get('TEST_DATABASE', 'sqlite')
+POSTGRESQL = 'postgresql'
+WORKER = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+PROCESS_ID = os.getpid()
+KINOPOISK_RATING = 7.5
+BEFORE_CURSOR_EXECUTE = 'before_cursor_execute'
+
+
+class KinopoiskResponse:
+    """Ответ заглушки API Кинопоиска.
+
+    Attributes:
+        status_code (int): Код ответа.
+        movie_id (str): Идентификатор запрошенного фильма.
+    """
+
+    status_code = OK
+
+    def __init__(self, movie_id: str) -> None:
+        """Сохраняет идентификатор запрошенного фильма.
+
+        Args:
+            movie_id: Идентификатор фильма.
+        """
+        self.movie_id = movie_id
+
+    def raise_for_status(self) -> None:
+        """Ничего не делает: заглушка всегда отвечает успешно."""
+
+    def json(self) -> dict:
+        """Возвращает данные о фильме в формате API Кинопоиска.
+
+        Returns:
+            dict: Данные о фильме.
+        """
+        return {
+            NAME: f'Фильм {self.movie_id}',
+            'year': 2000,
+            'description': 'Описание',
+            'rating': {'kp': KINOPOISK_RATING},
+            'genres': [{NAME: 'драма'}],
+            'poster': {'url': f'https://example.com/{self.movie_id}.jpg'},
+            'persons': [
+                {NAME: 'Актер', 'profession': 'актеры'},
+                {NAME: 'Режиссер', 'profession': 'режиссеры'},
+            ],
+        }
+
+
+def on_sqlite_connect(dbapi_connection, _connection_record) -> None:
+    """Передает управление транзакциями SQLAlchemy, чтобы работали SAVEPOINT.
+
+    Args:
+        dbapi_connection: Соединение драйвера sqlite3.
+        _connection_record: Запись пула соединений.
+    """
+    dbapi_connection.isolation_level = None
+
+
+def on_sqlite_begin(connection) -> None:
+    """Явно начинает транзакцию в SQLite.
+
+    Args:
+        connection: Соединение SQLAlchemy.
+    """
+    connection.exec_driver_sql('BEGIN')
+
+
+def session_scope() -> int:
+    """Возвращает ключ сессии: своя сессия у каждого запроса, общая у кода теста.
+
+    Returns:
+        int: Идентификатор текущего запроса или 0 вне запроса.
+    """
+    if has_request_context():
+        return id(request.environ)
+    return 0
+
+
+def remove_request_session(_exception) -> None:
+    """Закрывает сессию запроса, как это делает Flask-SQLAlchemy в приложении.
+
+    Args:
+        _exception: Исключение, которым завершился запрос.
+    """
+    db.session.remove()
+
+
+def record_statement(executed: list, _connection, _cursor, statement: str, *_args) -> None:
+    """Сохраняет текст SQL-запроса перед его выполнением.
+
+    Args:
+        executed: Список, в который сохраняются запросы.
+        _connection: Соединение SQLAlchemy.
+        _cursor: Курсор драйвера.
+        statement: Текст SQL-запроса.
+        _args: Остальные аргументы события before_cursor_execute.
+    """
+    executed.append(statement)
+
+
+def kinopoisk_get(requested_urls: list, url: str, **_kwargs) -> KinopoiskResponse:
+    """Заменяет requests.get при запросах к API Кинопоиска.
+
+    Args:
+        requested_urls: Список, в который сохраняются запрошенные адреса.
+        url: Адрес запроса.
+        _kwargs: Остальные аргументы requests.get.
+
+    Returns:
+        KinopoiskResponse: Ответ заглушки.
+    """
+    requested_urls.append(url)
+    return KinopoiskResponse(url.rsplit('/', 1)[-1])
+
+
+def insert_movies(session: scoped_session, count: int) -> None:
+    """Быстро добавляет много фильмов одним запросом.
+
+    Args:
+        session: Сессия с откатом после теста.
+        count: Количество фильмов.
+    """
+    session.execute(
+        sa.insert(Movie),
+        [
+            {'title': f'Фильм {index}', 'year': 2000, 'description': 'Описание'}
+            for index in range(count)
+        ],
+    )
+    session.commit()
+
+
+@pytest.fixture(scope='session')
+def database() -> dict:
+    """Создает отдельную базу данных для процесса pytest.
+
+    По умолчанию используется SQLite в памяти. С TEST_DATABASE=postgresql
+    используется PostgreSQL из переменных PG_* и отдельная схема для
+    каждого процесса pytest-xdist, которая удаляется после тестов.
+
+    Yields:
+        dict: Настройки подключения к базе данных для приложения.
+    """
+    if TEST_DATABASE != POSTGRESQL:
+        yield {
+            'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+            'SQLALCHEMY_ENGINE_OPTIONS': {
+                'poolclass': sa.pool.StaticPool,
+                'connect_args': {'check_same_thread': False},
+            },
+        }
+        return
+
+    schema = f'test_{WORKER}_{PROCESS_ID}'
+    engine = sa.create_engine(get_connection())
+    with engine.begin() as connection:
+        connection.execute(sa.schema.CreateSchema(schema))
+    yield {
+        'SQLALCHEMY_DATABASE_URI': get_connection(),
+        'SQLALCHEMY_ENGINE_OPTIONS': {
+            'connect_args': {'options': f'-csearch_path={schema}'},
+        },
+    }
+    with engine.begin() as connection:
+        connection.execute(sa.schema.DropSchema(schema, cascade=True))
+    engine.dispose()
+
+
+@pytest.fixture(scope='session')
+def app(database: dict) -> Flask:
+    """Создает приложение для тестирования.
+
+    Args:
+        database (dict): Настройки подключения к базе данных.
+
+    Yields:
+        Flask: Приложение Flask.
+    """
+    app = create_app({'TESTING': True, 'SEED_MOVIES': False, **database})
+    app.teardown_request(remove_request_session)
+    if TEST_DATABASE != POSTGRESQL:
+        with app.app_context():
+            sa.event.listen(db.engine, 'connect', on_sqlite_connect)
+            sa.event.listen(db.engine, 'begin', on_sqlite_begin)
+            db.engine.dispose()
+            db.create_all()
+
+    yield app
+
+    with app.app_context():
+        db.drop_all()
+
+
+@contextmanager
+def rollback_session(app: Flask) -> Iterator[scoped_session]:
+    """Открывает контекст приложения и транзакцию, которая затем откатывается.
+
+    Коммиты приложения и тестов фиксируют только SAVEPOINT внутри этой
+    транзакции, поэтому тесты не видят данных друг друга. Каждый запрос
+    получает собственную сессию, как в рабочем приложении.
+
+    Args:
+        app (Flask): Приложение Flask.
+
+    Yields:
+        scoped_session: Сессия, которой подменяется db.session.
+    """
+    with app.app_context():
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        test_session = scoped_session(
+            sessionmaker(bind=connection, join_transaction_mode='create_savepoint'),
+            scopefunc=session_scope,
+        )
+        app_session = db.session
+        db.session = test_session
+
+        yield test_session
+
+        test_session.remove()
+        db.session = app_session
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def session(app: Flask) -> scoped_session:
+    """Выполняет тест в транзакции, которая откатывается после него.
+
+    Args:
+        app (Flask): Приложение Flask.
+
+    Yields:
+        scoped_session: Сессия, которой подменяется db.session.
+    """
+    with rollback_session(app) as test_session:
+        yield test_session
+
+
+@pytest.fixture
+def client(app: Flask, session: scoped_session) -> FlaskClient:
+    """Инициализирует клиента для тестирования приложения.
+
+    Args:
+        app (Flask): Приложение Flask.
+        session (scoped_session): Сессия с откатом после теста.
+
+    Returns:
+        FlaskClient: Клиент Flask для тестирования.
+    """
+    return app.test_client()
+
+
+@pytest.fixture
+def statements(session: scoped_session) -> list:
+    """Собирает SQL-запросы, которые приложение отправляет в базу данных.
+
+    Args:
+        session (scoped_session): Сессия с откатом после теста.
+
+    Yields:
+        list: Тексты выполненных SQL-запросов.
+    """
+    executed = []
+    listener = partial(record_statement, executed)
+    sa.event.listen(db.engine, BEFORE_CURSOR_EXECUTE, listener)
+    yield executed
+    sa.event.remove(db.engine, BEFORE_CURSOR_EXECUTE, listener)
+
+
+@pytest.fixture(autouse=True)
+def kinopoisk(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Подменяет запросы к API Кинопоиска, чтобы тесты работали без сети.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Фикстура для подмены объектов.
+
+    Returns:
+        list: Адреса, запрошенные у заглушки.
+    """
+    requested_urls = []
+    monkeypatch.setattr('app.requests.get', partial(kinopoisk_get, requested_urls))
+    return requested_urls
+
+
+@pytest.fixture
+def make_movies(session: scoped_session) -> Callable[[int], None]:
+    """Возвращает функцию, которая быстро добавляет много фильмов.
+
+    Args:
+        session (scoped_session): Сессия с откатом после теста.
+
+    Returns:
+        Callable[[int], None]: Функция, принимающая количество фильмов.
+    """
+    return partial(insert_movies, session)
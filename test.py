@@ -2,12 +2,9 @@
 
 import os
 
-import pytest
-from dotenv import load_dotenv
 from flask import Flask
-from flask.testing import FlaskClient
 
-from app import Movie, User, app, db
+from app import Movie, User, db
 from config import NOT_FOUND, OK
 
 TEST_YEAR = 2023
@@ -17,55 +14,6 @@ PATH_USERS = '/users/'
 MESSAGE = 'message'
 USERNAME = 'username'
 
-load_dotenv()
-
-
-def get_connection() -> str:
-    """
-    Получает строку подключения к базе данных PostgreSQL из переменных окружения.
-
-    Returns:
-        str: Строка подключения к базе данных PostgreSQL'
-    """
-    consts = 'PG_USER', 'PG_PASSWORD', 'PG_HOST', 'PG_PORT', 'PG_DBNAME'
-    user, password, host, port, dbname = [os.environ.get(const) for const in consts]
-
-    return f'postgresql://{user}:{password}@{host}:{port}/{dbname}'
-
-
-@pytest.fixture(scope='session')
-def app_with_db():
-    """Инициализирует приложение с базой данных для тестирования.
-
-    Yields:
-        tuple: Кортеж с объектом приложения и базой данных.
-    """
-    app.config['TESTING'] = True
-    app.config['SQLALCHEMY_DATABASE_URI'] = get_connection()
-    app_context = app.app_context()
-    app_context.push()
-    db.create_all()
-
-    yield app, db
-
-    db.session.remove()
-    db.drop_all()
-    app_context.pop()
-
-
-@pytest.fixture
-def client(app_with_db: tuple) -> FlaskClient:
-    """Инициализирует клиента для тестирования приложения.
-
-    Args:
-        app_with_db (tuple): Кортеж с объектом приложения и базой данных.
-
-    Returns:
-        FlaskClient: Клиент Flask для тестирования.
-    """
-    app, _ = app_with_db
-    return app.test_client()
-
 
 def test_get_movie(client: Flask) -> None:
     """Тест для получения информации о конкретном фильме.
@@ -0,0 +1,96 @@
+"""Данный модуль тестирует сжатие ответов API."""
+
+import gzip
+import json
+from types import MappingProxyType
+
+import pytest
+from flask import Flask
+
+from app import Movie, db
+from config import NOT_MODIFIED, OK
+
+TEST_YEAR = 2023
+TEST_FILM = 'Фильм 1'
+PATH_MOVIES = '/movies'
+MIN_SIZE = 'COMPRESS_MIN_SIZE'
+GZIP_HEADERS = MappingProxyType({'Accept-Encoding': 'gzip'})
+
+
+def test_get_movies_compressed(
+    app: Flask, client: Flask, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Тест для получения сжатого списка фильмов.
+
+    Args:
+        app (Flask): Приложение Flask.
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+        monkeypatch (pytest.MonkeyPatch): Фикстура для изменения конфигурации.
+    """
+    monkeypatch.setitem(app.config, MIN_SIZE, 0)
+    db.session.add(Movie(title=TEST_FILM, year=TEST_YEAR))
+    db.session.commit()
+
+    response = client.get(PATH_MOVIES, headers=GZIP_HEADERS)
+    assert response.status_code == OK
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(response.data))[0]['title'] == TEST_FILM
+
+
+def test_get_movies_not_modified(
+    app: Flask, client: Flask, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Тест для проверки ответа 304 при совпадении ETag сжатого ответа.
+
+    Args:
+        app (Flask): Приложение Flask.
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+        monkeypatch (pytest.MonkeyPatch): Фикстура для изменения конфигурации.
+    """
+    monkeypatch.setitem(app.config, MIN_SIZE, 0)
+    etag = client.get(PATH_MOVIES, headers=GZIP_HEADERS).headers['ETag']
+
+    response = client.get(PATH_MOVIES, headers={**GZIP_HEADERS, 'If-None-Match': etag})
+    assert response.status_code == NOT_MODIFIED
+
+
+def test_head_movies_uses_etag(
+    app: Flask, client: Flask, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Тест для проверки, что HEAD-запрос получает тот же ETag, что и GET.
+
+    Args:
+        app (Flask): Приложение Flask.
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+        monkeypatch (pytest.MonkeyPatch): Фикстура для изменения конфигурации.
+    """
+    monkeypatch.setitem(app.config, MIN_SIZE, 0)
+    etag = client.get(PATH_MOVIES, headers=GZIP_HEADERS).headers['ETag']
+
+    response = client.head(PATH_MOVIES, headers=GZIP_HEADERS)
+    assert response.status_code == OK
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['ETag'] == etag
+
+
+def test_compression_cache_limited_by_bytes(
+    app: Flask, client: Flask, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Тест для проверки, что кэш сжатых ответов не превышает лимит в байтах.
+
+    Args:
+        app (Flask): Приложение Flask.
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+        monkeypatch (pytest.MonkeyPatch): Фикстура для изменения конфигурации.
+    """
+    monkeypatch.setitem(app.config, MIN_SIZE, 0)
+    first_size = len(client.get(PATH_MOVIES, headers=GZIP_HEADERS).data)
+    monkeypatch.setitem(app.config, 'COMPRESS_CACHE_BYTES', first_size)
+    db.session.add(Movie(title='Фильм для проверки кэша', year=TEST_YEAR))
+    db.session.commit()
+
+    response = client.get(PATH_MOVIES, headers=GZIP_HEADERS)
+    assert response.status_code == OK
+    state = app.extensions['compression']
+    assert state['cache_bytes'] <= first_size
+    assert state['cache_bytes'] == sum(len(body) for body in state['cache'].values())
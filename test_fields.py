@@ -0,0 +1,154 @@
+"""Данный модуль тестирует выбор полей через параметр fields."""
+
+import os
+
+from flask import Flask
+
+from app import Movie, User, db
+from config import BAD_REQUEST, OK
+
+TEST_YEAR = 2023
+TEST_PASSWORD = os.environ.get('TEST_PASSWORD')
+TEST_FILM = 'Фильм 1'
+TEST_DESCRIPTION = 'Описание'
+PATH_USERS = '/users/'
+USERNAME = 'username'
+PASSWORD = 'password'
+DESCRIPTION = 'description'
+TITLE = 'title'
+MOVIE_TITLE_FIELDS = frozenset(('id', TITLE))
+
+
+def test_get_movies_fields(client: Flask, statements: list) -> None:
+    """Тест для получения списка фильмов только с запрошенными полями.
+
+    Args:
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+        statements (list): SQL-запросы, выполненные во время теста.
+    """
+    db.session.add(Movie(title=TEST_FILM, year=TEST_YEAR, description=TEST_DESCRIPTION))
+    db.session.commit()
+    statements.clear()
+
+    response = client.get('/movies?fields=id,title')
+    assert response.status_code == OK
+    assert all(set(movie_data) == MOVIE_TITLE_FIELDS for movie_data in response.json)
+    assert any('movie.title' in statement for statement in statements)
+    assert all(DESCRIPTION not in statement for statement in statements)
+
+
+def test_get_movie_fields(client: Flask, statements: list) -> None:
+    """Тест для получения фильма только с запрошенными полями.
+
+    Args:
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+        statements (list): SQL-запросы, выполненные во время теста.
+    """
+    movie = Movie(title=TEST_FILM, year=TEST_YEAR, description=TEST_DESCRIPTION)
+    db.session.add(movie)
+    db.session.commit()
+    movie_id = movie.id
+    statements.clear()
+
+    response = client.get(f'/movies/{movie_id}?fields=title,year')
+    assert response.status_code == OK
+    assert response.json == {TITLE: TEST_FILM, 'year': TEST_YEAR}
+    assert statements
+    assert all(DESCRIPTION not in statement for statement in statements)
+
+
+def test_search_movies_fields(client: Flask) -> None:
+    """Тест для поиска фильмов только с запрошенными полями.
+
+    Args:
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+    """
+    db.session.add(Movie(title=TEST_FILM, year=TEST_YEAR, description=TEST_DESCRIPTION))
+    db.session.commit()
+
+    response = client.get(f'/movies/search?title={TEST_FILM}&fields=id,title')
+    assert response.status_code == OK
+    assert response.json
+    assert all(set(movie_data) == MOVIE_TITLE_FIELDS for movie_data in response.json)
+
+
+def test_get_movies_empty_fields(client: Flask) -> None:
+    """Тест для проверки, что пустой параметр fields отклоняется.
+
+    Args:
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+    """
+    response = client.get('/movies?fields=')
+    assert response.status_code == BAD_REQUEST
+
+
+def test_get_user_fields(client: Flask, statements: list) -> None:
+    """Тест для получения пользователя только с запрошенными полями.
+
+    Args:
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+        statements (list): SQL-запросы, выполненные во время теста.
+    """
+    user = User(username='user8', email='user8@example.com', password=TEST_PASSWORD)
+    db.session.add(user)
+    db.session.commit()
+    user_id = user.id
+    statements.clear()
+
+    response = client.get(f'{PATH_USERS}{user_id}?fields={USERNAME}')
+    assert response.status_code == OK
+    assert response.json == {USERNAME: 'user8'}
+    assert statements
+    assert all(PASSWORD not in statement for statement in statements)
+
+
+def test_get_user_fields_watchlist(client: Flask) -> None:
+    """Тест для получения списка "хочу посмотреть" пользователя через fields.
+
+    Args:
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+    """
+    user = User(username='user9', email='user9@example.com', password=TEST_PASSWORD)
+    user.watchlist.append(Movie(title=TEST_FILM, year=TEST_YEAR))
+    db.session.add(user)
+    db.session.commit()
+
+    response = client.get(f'{PATH_USERS}{user.id}?fields=id,watchlist')
+    assert response.status_code == OK
+    assert set(response.json) == {'id', 'watchlist'}
+    assert response.json['watchlist'][0][TITLE] == TEST_FILM
+
+
+def test_get_user_fields_nested(client: Flask, statements: list) -> None:
+    """Тест для получения только запрошенных полей фильмов из списка пользователя.
+
+    Args:
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+        statements (list): SQL-запросы, выполненные во время теста.
+    """
+    user = User(username='user11', email='user11@example.com', password=TEST_PASSWORD)
+    user.watchlist.append(Movie(title=TEST_FILM, year=TEST_YEAR, description=TEST_DESCRIPTION))
+    db.session.add(user)
+    db.session.commit()
+    user_id = user.id
+    statements.clear()
+
+    response = client.get(f'{PATH_USERS}{user_id}?fields=watchlist.title')
+    assert response.status_code == OK
+    assert response.json == {'watchlist': [{TITLE: TEST_FILM}]}
+    assert statements
+    assert all(DESCRIPTION not in statement for statement in statements)
+
+
+def test_get_user_fields_password(client: Flask) -> None:
+    """Тест для проверки, что через fields нельзя запросить пароль пользователя.
+
+    Args:
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+    """
+    user = User(username='user10', email='user10@example.com', password=TEST_PASSWORD)
+    db.session.add(user)
+    db.session.commit()
+
+    response = client.get(f'{PATH_USERS}{user.id}?fields={USERNAME},{PASSWORD}')
+    assert response.status_code == BAD_REQUEST
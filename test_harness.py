@@ -0,0 +1,58 @@
+"""Данный модуль тестирует окружение для запуска тестов."""
+
+from collections.abc import Callable
+
+from flask import Flask
+
+from app import ID_FILM1, Movie, get_movie_info
+from config import OK
+from conftest import rollback_session
+
+TEST_YEAR = 2023
+MOVIE_TITLE_FIELDS = frozenset(('id', 'title'))
+LARGE_CATALOGUE = 1000
+
+
+def test_get_movie_info(kinopoisk: list) -> None:
+    """Тест для получения информации о фильме из API Кинопоиска.
+
+    Args:
+        kinopoisk (list): Адреса, запрошенные у заглушки API Кинопоиска.
+    """
+    movie_info = get_movie_info(ID_FILM1)
+    assert movie_info['title'] == f'Фильм {ID_FILM1}'
+    assert movie_info['director'] == ['Режиссер']
+    assert kinopoisk == [f'https://api.kinopoisk.dev/v1.4/movie/{ID_FILM1}']
+
+
+def test_tests_are_isolated(app: Flask) -> None:
+    """Тест для проверки, что данные теста откатываются после него.
+
+    Args:
+        app (Flask): Приложение Flask.
+    """
+    title = 'Фильм для проверки отката'
+    with rollback_session(app) as first_session:
+        first_session.add(Movie(title=title, year=TEST_YEAR))
+        first_session.commit()
+        assert first_session.query(Movie).filter_by(title=title).count() == 1
+
+    with rollback_session(app) as second_session:
+        assert second_session.query(Movie).filter_by(title=title).count() == 0
+
+
+def test_get_movies_large_catalogue_fields(
+    client: Flask, make_movies: Callable[[int], None],
+) -> None:
+    """Тест для получения большого каталога только с запрошенными полями.
+
+    Args:
+        client (Flask): Клиент Flask для взаимодействия с приложением.
+        make_movies: Функция для добавления фильмов.
+    """
+    make_movies(LARGE_CATALOGUE)
+
+    response = client.get('/movies?fields=id,title')
+    assert response.status_code == OK
+    assert len(response.json) == LARGE_CATALOGUE
+    assert all(set(movie_data) == MOVIE_TITLE_FIELDS for movie_data in response.json)
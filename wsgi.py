@@ -0,0 +1,5 @@
+"""Модуль создает приложение для WSGI-серверов."""
+
+from app import create_app
+
+app = create_app()